@@ -1,3 +1,5 @@
 from .sceneMenu import MenuScene
 from .sceneCreation import CreationScene
-from .sceneInfoBox import InfoBoxScene
\ No newline at end of file
+from .sceneInfoBox import InfoBoxScene
+from .sceneLoading import LoadingScene
+from .sceneGallery import GalleryScene
\ No newline at end of file
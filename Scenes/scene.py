@@ -1,12 +1,77 @@
+import pygame as pg
+from tools.profiler import profiler
+from tools.widgets import WidgetManager
+
+
 class Scene:
+    # True, пока в сцене идёт анимация - директор не снижает частоту кадров
+    animating = False
+    # картинки, которые директор декодирует в фоне до создания сцены
+    ASSETS = ()
+
     def __init__(self, director):
         self.director = director
-    
+        self.background = None
+        self.dirty_rects = []
+        self.full_redraw = True
+        self.widgets = WidgetManager()
+
     def handle_events(self, events):
         pass
-    
+
     def update(self, dt):
         pass
-    
+
     def render(self, screen):
-        pass
\ No newline at end of file
+        pass
+
+    def cleanup(self):
+        """Сцену выгружают - освободить ресурсы"""
+        pass
+
+    def on_enter(self):
+        """Сцена снова на экране - перерисовать её целиком"""
+        self.full_redraw = True
+        self.dirty_rects.clear()
+        self.widgets.sync(pg.mouse.get_pos())
+
+    def draw_background(self, surface):
+        """Статичный слой сцены, рисуется один раз в кэш"""
+        pass
+
+    def get_background(self, screen):
+        if self.background is None:
+            self.background = pg.Surface(screen.get_size()).convert()
+            profiler.alloc()
+            self.draw_background(self.background)
+        return self.background
+
+    def blit_background(self, screen):
+        """Нарисовать фон целиком, если сцена требует полной перерисовки"""
+        if self.full_redraw:
+            screen.blit(self.get_background(screen), (0, 0))
+            profiler.blit()
+
+    def restore_background(self, screen, rect):
+        """Восстановить фон под прямоугольником и отметить его грязным"""
+        if not self.full_redraw:
+            screen.blit(self.get_background(screen), rect, rect)
+            profiler.blit()
+        self.mark_dirty(rect)
+
+    def mark_dirty(self, rect):
+        self.dirty_rects.append(pg.Rect(rect))
+
+    def pop_dirty_rects(self):
+        """Изменённые области за кадр; None - обновить весь экран"""
+        if self.full_redraw:
+            self.full_redraw = False
+            self.dirty_rects.clear()
+            return None
+        rects = self.dirty_rects
+        self.dirty_rects = []
+        return rects
+
+    @property
+    def needs_redraw(self):
+        return self.full_redraw or bool(self.dirty_rects)
@@ -4,28 +4,33 @@ from config import BEIGE, BROWN, font
 from tools.buttons import Button
 from tools.text_boxes import Text
 class CreationScene(Scene):
+    BG_PATH = "./images/clan_four_light.png"
+    ASSETS = (BG_PATH,)
+
     def __init__(self, director):
         super().__init__(director)
         try:
-            bg_path = "./images/clan_four_light.png"
-            self.bg_image = pg.image.load(bg_path).convert_alpha()
-            self.bg_image.set_colorkey(BROWN)
+            self.bg_image = director.assets.image(self.BG_PATH, colorkey=BROWN)
             self.bg_rect = self.bg_image.get_rect()
         except Exception as e:
             print("Не удалось загрузить фоновое изображение:", e)
             self.bg_image = None
 
-        self.title = Text(400, 100, "Привет, мир!", pg.font.Font(None, 48), (255, 255, 255))
+        self.title = Text(400, 100, "Привет, мир!", (None, 48), (255, 255, 255))
     def handle_events(self, events):
         for event in events:
             if event.type == pg.KEYDOWN:
                 if event.key == pg.K_SPACE:  # или любая клавиша
                     self.director.switch_scene("menu")
     
+    def draw_background(self, surface):
+        surface.fill(BEIGE)
+        if self.bg_image:
+            self.bg_rect.bottom = surface.get_height()
+            surface.blit(self.bg_image, self.bg_rect)
+        self.title.draw(surface)
+
     def render(self, screen):
-        screen.fill(BEIGE)
-        self.bg_rect.bottom = screen.get_height()
-        screen.blit(self.bg_image, self.bg_rect)
-        self.title.draw(screen)
+        self.blit_background(screen)
         
 
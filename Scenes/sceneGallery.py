@@ -0,0 +1,44 @@
+import glob
+import pygame as pg
+from .scene import Scene
+from config import BEIGE, BLACK, font
+from tools.gallery import ScrollGallery
+from tools.text_boxes import Text
+
+
+class GalleryScene(Scene):
+    """Просмотр patrol_art: колесо, стрелки, PageUp/PageDown; Esc - в меню"""
+
+    def __init__(self, director):
+        super().__init__(director)
+        paths = sorted(glob.glob("./from_clangen/images/patrol_art/*.png"))
+        self.gallery = ScrollGallery((20, 60, 760, 620), paths, thumb_size=(140, 140))
+        self.title = Text(400, 30, f"Patrol art: {len(paths)}", font, BLACK)
+
+    @property
+    def animating(self):
+        return self.gallery.animating
+
+    def handle_events(self, events):
+        self.gallery.handle_events(events)
+        for event in events:
+            if event.type == pg.KEYDOWN and event.key in (pg.K_ESCAPE, pg.K_BACKSPACE):
+                self.director.switch_scene("menu")
+
+    def update(self, dt):
+        self.gallery.update(dt)
+
+    def draw_background(self, surface):
+        surface.fill(BEIGE)
+        self.title.draw(surface)
+
+    def render(self, screen):
+        self.blit_background(screen)
+        if self.full_redraw:
+            self.gallery.dirty = True
+        rect = self.gallery.draw(screen)
+        if rect is not None:
+            self.mark_dirty(rect)
+
+    def cleanup(self):
+        self.gallery.close()
@@ -3,29 +3,35 @@ from Scenes.scene import Scene
 from config import WHITE, font
 from tools.buttons import Button
 class InfoBoxScene(Scene):
+    BUTTON_PATH = "./images/buttons/button.png"
+    ASSETS = (BUTTON_PATH,)
+
     def __init__(self, director):
         super().__init__(director)
         self.buttons = []
         try:
-            bt_path = "./images/buttons/button.png"
-            bt_img = pg.image.load(bt_path).convert_alpha()
-            self.bt_back = Button(50, 600, bt_img, 1, "Back", font)
+            self.bt_back = self.widgets.add(Button(50, 600, self.BUTTON_PATH, 1, "Back", font, assets=director.assets,
+                                                   on_click=lambda: director.switch_scene("menu")))
             
         except Exception as e:
             print("Не удалось загрузить кнопки:", e)
             self.bg_image = None
         
     def handle_events(self, events):
+        self.widgets.handle_events(events)
         for event in events:
             if event.type == pg.KEYDOWN:
                 if event.key == pg.K_SPACE:  # или любая клавиша
                     self.director.switch_scene("menu")
     
+    def draw_background(self, surface):
+        surface.fill(WHITE)
+
     def render(self, screen):
-        screen.fill(WHITE)
-        if self.bt_back.draw(screen):
-            self.director.switch_scene("menu")
+        self.blit_background(screen)
+        self.widgets.draw(self, screen)
 
     def cleanup(self):
         self.buttons.clear()
+        self.widgets.clear()
         self.bt_start = None
\ No newline at end of file
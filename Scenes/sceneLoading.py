@@ -0,0 +1,54 @@
+from .scene import Scene
+from config import BEIGE
+from tools.profiler import profiler
+
+
+class LoadingScene(Scene):
+    """Анимация загрузки, пока ассеты следующей сцены декодируются в фоне"""
+    animating = True
+    frame_time = 0.08
+
+    def __init__(self, director):
+        super().__init__(director)
+        self.target = None
+        self.paths = ()
+        self.frame = 0
+        self.elapsed = 0
+        self.frames = []
+        for i in range(1, 11):
+            path = f"./from_clangen/images/loading_animate/startup/{i}.png"
+            try:
+                self.frames.append(director.assets.image(path))
+            except Exception as e:
+                print("Не удалось загрузить кадр загрузки:", e)
+                break
+
+    def start(self, target, paths):
+        self.target = target
+        self.paths = paths
+        self.frame = 0
+        self.elapsed = 0
+
+    def update(self, dt):
+        self.director.assets.poll()
+        if self.director.assets.finished(self.paths):
+            self.director.switch_scene(self.target, preload=False)
+            return
+        self.elapsed += dt
+        if self.elapsed >= self.frame_time and self.frames:
+            self.elapsed = 0
+            self.frame = (self.frame + 1) % len(self.frames)
+
+    def draw_background(self, surface):
+        surface.fill(BEIGE)
+
+    def render(self, screen):
+        if not self.frames:
+            self.blit_background(screen)
+            return
+        image = self.frames[self.frame]
+        rect = image.get_rect(center=screen.get_rect().center)
+        self.blit_background(screen)
+        self.restore_background(screen, rect)
+        screen.blit(image, rect)
+        profiler.blit()
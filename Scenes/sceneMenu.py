@@ -3,35 +3,42 @@ from .scene import Scene
 from config import BLUE, font
 from tools.buttons import Button
 class MenuScene(Scene):
+    BG_PATH = "./images/menu.png"
+    BUTTON_PATH = "./images/buttons/button.png"
+    ASSETS = (BG_PATH, BUTTON_PATH)
+
     def __init__(self, director):
         super().__init__(director)
         try:
-            bg_path = "./images/menu.png"
-            self.bg_image = pg.image.load(bg_path).convert_alpha()
+            self.bg_image = director.assets.image(self.BG_PATH)
             self.bg_rect = self.bg_image.get_rect()
         except Exception as e:
             print("Не удалось загрузить фоновое изображение:", e)
             self.bg_image = None
         try:
-            bt_path = "./images/buttons/button.png"
-            bt_img = pg.image.load(bt_path).convert_alpha()
-            self.bt_start = Button(50, 400, bt_img, 1, "text", font)
-            self.bt_infobox = Button(50, 500, bt_img, 1, "text", font)
+            self.bt_start = self.widgets.add(Button(50, 400, self.BUTTON_PATH, 1, "text", font, assets=director.assets,
+                                                    on_click=lambda: director.switch_scene("creation")))
+            self.bt_infobox = self.widgets.add(Button(50, 500, self.BUTTON_PATH, 1, "text", font, assets=director.assets,
+                                                      on_click=lambda: director.switch_scene("infobox")))
         except Exception as e:
             print("Не удалось загрузить кновки:", e)
             self.bg_image = None
     def handle_events(self, events):
+        self.widgets.handle_events(events)
         for event in events:
             if event.type == pg.KEYDOWN:
                 if event.key == pg.K_SPACE:  # или любая клавиша
                     self.director.switch_scene("creation")
+                elif event.key == pg.K_g:
+                    self.director.switch_scene("gallery")
     
+    def draw_background(self, surface):
+        surface.fill(BLUE)
+        if self.bg_image:
+            surface.blit(self.bg_image, self.bg_rect)
+
     def render(self, screen):
-        screen.fill(BLUE)
-        screen.blit(self.bg_image, self.bg_rect)
-        if self.bt_start.draw(screen):
-            self.director.switch_scene("creation")
-        if self.bt_infobox.draw(screen):
-            self.director.switch_scene("infobox")
+        self.blit_background(screen)
+        self.widgets.draw(self, screen)
         
 
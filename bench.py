@@ -0,0 +1,304 @@
+"""Безголовый бенчмарк сцен.
+
+Запускает Director с dummy-драйверами SDL, проигрывает сценарий ввода
+(клавиши, клики по кнопкам, переходы между сценами) и пишет в JSON время
+запуска, создания сцен, загрузки ассетов и перцентили времени кадра.
+Сценарий прогоняется несколько раз в отдельных процессах, в результат
+идёт медиана каждой метрики - одиночный прогон слишком шумный для сравнения.
+
+    python bench.py --output bench.json
+    python bench.py --baseline bench.json --tolerance 0.25
+"""
+import time
+START = time.perf_counter()
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame as pg
+
+# frames - кадры без ввода, paced - то же, но в темпе FPS (фоновые потоки успевают работать),
+# move - кадры с движением мыши (сцена перерисовывается),
+# click - имя атрибута-кнопки в текущей сцене, until - дождаться сцены
+DEFAULT_SCRIPT = [
+    {"until": "menu"},
+    {"frames": 60},
+    {"move": 120},
+    {"click": "bt_start"},
+    {"until": "creation"},
+    {"move": 120},
+    {"key": "space"},
+    {"until": "menu"},
+    {"click": "bt_infobox"},
+    {"until": "infobox"},
+    {"move": 120},
+    {"click": "bt_back"},
+    {"until": "menu"},
+    {"key": "space"},
+    {"until": "creation"},
+    {"key": "space"},
+    {"until": "menu"},
+    {"frames": 60},
+    # галерея patrol_art: листаем все 625 картинок до конца и обратно
+    {"key": "g"},
+    {"until": "gallery"},
+    {"paced": 30},
+    *[{"key": "page down"}, {"paced": 10}] * 30,
+    {"key": "end"},
+    {"paced": 60},
+    {"key": "home"},
+    {"paced": 60},
+    {"key": "escape"},
+    {"until": "menu"},
+]
+UNTIL_TIMEOUT = 600  # кадров
+RUNS = 5  # прогонов сценария, в результат идёт медиана
+# перцентиль по малому числу кадров - почти максимум; меньше стольких кадров не сравниваем
+MIN_FRAMES = {"p95_ms": 20, "p99_ms": 100}
+
+
+class NoDelayClock():
+    """Часы без ожидания: в бенчмарке меряем работу кадра, а не sleep"""
+
+    def __init__(self):
+        self.last = time.perf_counter()
+
+    def tick(self, fps=0):
+        now = time.perf_counter()
+        dt = (now - self.last) * 1000
+        self.last = now
+        return dt
+
+
+class ScriptedMouse():
+    """Подменяет позицию мыши: сцены спрашивают её при входе"""
+
+    def __init__(self):
+        self.pos = (0, 0)
+        pg.mouse.get_pos = lambda: self.pos
+
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))
+    return values[index]
+
+
+class Bench():
+    def __init__(self, script):
+        self.script = script
+        self.frames = {}  # сцена -> времена перерисованных кадров, мс
+        self.skipped = {}  # сцена -> кадры без перерисовки
+        self.startup = None
+        self.thumbnails = {}  # сцена -> максимум миниатюр в памяти
+
+    def scene_name(self):
+        return self.director.scene_name
+
+    def frame(self):
+        # кадр и миниатюры записываем на сцену, которая была до step()
+        name = self.scene_name()
+        scene = self.director.current_scene
+        start = time.perf_counter()
+        rendered = self.director.step()
+        elapsed = (time.perf_counter() - start) * 1000
+        if rendered:
+            self.frames.setdefault(name, []).append(elapsed)
+            if self.startup is None and name != "loading":
+                self.startup = time.perf_counter() - START
+        else:
+            self.skipped[name] = self.skipped.get(name, 0) + 1
+        gallery = getattr(scene, "gallery", None)
+        if gallery is not None:
+            count = gallery.stats()["thumbnails"]
+            self.thumbnails[name] = max(self.thumbnails.get(name, 0), count)
+        return elapsed
+
+    def run(self):
+        from director import Director
+        self.director = Director()
+        self.director.clock = NoDelayClock()
+        self.mouse = ScriptedMouse()
+        for action in self.script:
+            self.play(action)
+        self.director.assets.shutdown()
+        return self.report()
+
+    def play(self, action):
+        if "frames" in action:
+            for _ in range(action["frames"]):
+                self.frame()
+        elif "paced" in action:
+            budget = 1000 / self.director.FPS
+            for _ in range(action["paced"]):
+                elapsed = self.frame()
+                time.sleep(max(0.0, budget - elapsed) / 1000)
+        elif "move" in action:
+            width, height = self.director.screen.get_size()
+            for i in range(action["move"]):
+                pos = (i * 7 % width, i * 5 % height)
+                self.mouse.pos = pos
+                pg.event.post(pg.event.Event(pg.MOUSEMOTION, pos=pos, rel=(7, 5), buttons=(0, 0, 0)))
+                self.frame()
+        elif "key" in action:
+            key = pg.key.key_code(action["key"])
+            pg.event.post(pg.event.Event(pg.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+            pg.event.post(pg.event.Event(pg.KEYUP, key=key, mod=0, unicode="", scancode=0))
+            self.frame()
+        elif "click" in action:
+            button = getattr(self.director.current_scene, action["click"])
+            self.click(button.rect.center)
+        elif "until" in action:
+            for _ in range(UNTIL_TIMEOUT):
+                if self.scene_name() == action["until"]:
+                    return
+                self.frame()
+            raise RuntimeError(f"сцена {action['until']} не открылась за {UNTIL_TIMEOUT} кадров")
+
+    def click(self, pos):
+        self.mouse.pos = pos
+        pg.event.post(pg.event.Event(pg.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0)))
+        pg.event.post(pg.event.Event(pg.MOUSEBUTTONDOWN, pos=pos, button=1))
+        self.frame()
+        pg.event.post(pg.event.Event(pg.MOUSEBUTTONUP, pos=pos, button=1))
+        self.frame()
+
+    def report(self):
+        scenes = {}
+        for name, times in self.frames.items():
+            scenes[name] = {
+                "frames": len(times),
+                "skipped": self.skipped.get(name, 0),
+                "p50_ms": percentile(times, 50),
+                "p95_ms": percentile(times, 95),
+                "p99_ms": percentile(times, 99),
+                "max_ms": max(times),
+            }
+            if name in self.thumbnails:
+                scenes[name]["thumbnails_peak"] = self.thumbnails[name]
+        return {
+            "startup_s": self.startup,
+            "build_s": dict(self.director.build_times),
+            "assets_s": dict(self.director.assets.load_times),
+            "scenes": scenes,
+        }
+
+
+def flatten(data, prefix=""):
+    """{"a": {"b": 1}} -> {"a.b": 1}, только числа"""
+    result = {}
+    for key, value in data.items():
+        name = prefix + key
+        if isinstance(value, dict):
+            result.update(flatten(value, name + "."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            result[name] = value
+    return result
+
+
+def median_result(results):
+    """Медиана каждой числовой метрики по прогонам, вложенность сохраняется"""
+    merged = {}
+    for key in dict.fromkeys(key for result in results for key in result):
+        values = [result[key] for result in results if result.get(key) is not None]
+        if not values:
+            merged[key] = None
+        elif isinstance(values[0], dict):
+            merged[key] = median_result(values)
+        else:
+            merged[key] = statistics.median(values)
+    return merged
+
+
+def compare(result, baseline, tolerance, slack):
+    """Метрики, которые выросли больше допуска относительно базовой линии"""
+    regressions = []
+    current = flatten(result)
+    base_flat = flatten(baseline)
+    for name, base in base_flat.items():
+        # количество кадров - не время, а худший кадр слишком шумный - их не сравниваем
+        if name not in current or name.endswith((".frames", ".skipped", ".max_ms")):
+            continue
+        scene, _, metric = name.rpartition(".")
+        if metric in MIN_FRAMES:
+            frames = min(base_flat.get(scene + ".frames", 0), current.get(scene + ".frames", 0))
+            if frames < MIN_FRAMES[metric]:
+                continue
+        # slack задан в мс, а время запуска, сцен и ассетов - в секундах
+        limit = base * (1 + tolerance) + (slack if name.endswith("_ms") else slack / 1000)
+        if current[name] > limit:
+            regressions.append((name, base, current[name]))
+    return regressions
+
+
+def run_many(args):
+    """Прогнать сценарий args.runs раз, каждый в свежем процессе, и взять медианы"""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in range(args.runs):
+            output = os.path.join(tmp, f"run{n}.json")
+            command = [sys.executable, os.path.abspath(__file__), "--runs", "1", "--output", output]
+            if args.script:
+                command += ["--script", args.script]
+            if args.trace and n == 0:
+                command += ["--trace", args.trace]
+            subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+            with open(output, encoding="utf-8") as f:
+                results.append(json.load(f))
+    return median_result(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк сцен KOTY")
+    parser.add_argument("--script", help="JSON со сценарием вместо стандартного")
+    parser.add_argument("--output", help="куда записать результат (по умолчанию stdout)")
+    parser.add_argument("--baseline", help="JSON прошлого запуска для сравнения")
+    parser.add_argument("--trace", help="сохранить кадры прогона в Chrome trace JSON")
+    parser.add_argument("--runs", type=int, default=RUNS, help="сколько раз прогнать сценарий")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="допустимый рост, доля")
+    parser.add_argument("--slack", type=float, default=2.0, help="допустимый абсолютный рост, мс")
+    args = parser.parse_args()
+
+    script = DEFAULT_SCRIPT
+    if args.script:
+        with open(args.script, encoding="utf-8") as f:
+            script = json.load(f)
+
+    if args.runs > 1:
+        result = run_many(args)
+    else:
+        pg.init()
+        bench = Bench(script)
+        result = bench.run()
+        if args.trace:
+            bench.director.profiler.export_chrome_trace(args.trace)
+    text = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(result, baseline, args.tolerance, args.slack)
+        for name, base, value in regressions:
+            print(f"регрессия {name}: {base:.4f} -> {value:.4f}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+    pg.quit()
+
+
+if __name__ == '__main__':
+    main()
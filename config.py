@@ -9,4 +9,20 @@ BEIGE = (235, 217, 176)
 BROWN = (37, 150, 190)
 WIDTH, HEIGHT = 800, 700
 FPS = 60
-font = pg.font.Font("HUDSonicX1-Regular.otf", 20)
\ No newline at end of file
+IDLE_FPS = 15  # нет событий и анимаций
+BACKGROUND_FPS = 5  # окно свёрнуто или без фокуса
+IDLE_DELAY = 0.5  # секунд без активности до снижения частоты
+DIRTY_RENDERING = False  # обновлять только изменённые области экрана
+ASSET_BUDGET = 64 * 1024 * 1024  # байт под кэш изображений
+ATLAS_BUDGET = 96 * 1024 * 1024  # байт под спрайтшиты: все листы clangen (~85 МБ) влезают целиком
+TEXTURE_CACHE = False  # брать декодированные картинки из кэша на диске
+TEXTURE_CACHE_DIR = ".texture_cache"
+TEXT_CACHE_SIZE = 512  # поверхностей с текстом в кэше
+PROFILER_FRAMES = 600  # кадров в кольцевом буфере профилировщика
+PROFILER_KEY = pg.K_F3  # показать/скрыть оверлей
+PROFILER_EXPORT_KEY = pg.K_F4  # выгрузить окно в CSV и Chrome trace
+FONT_PATH = "HUDSonicX1-Regular.otf"
+FONT_SIZE = 20
+# шрифт - пара (файл, размер), сам файл открывает tools.text_cache при первом использовании
+font = (FONT_PATH, FONT_SIZE)
+PREWARM_TEXTS = ("text", "Back")
\ No newline at end of file
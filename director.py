@@ -1,45 +1,157 @@
 import pygame as pg
 import sys
 import time
-from config import WIDTH, HEIGHT, FPS
+from config import WIDTH, HEIGHT, FPS, IDLE_FPS, BACKGROUND_FPS, IDLE_DELAY, DIRTY_RENDERING, ASSET_BUDGET
+from config import ATLAS_BUDGET
+from config import TEXTURE_CACHE, TEXTURE_CACHE_DIR
+from config import BLACK, font, PREWARM_TEXTS, PROFILER_KEY, PROFILER_EXPORT_KEY
 from Scenes import *
+from tools.assets import AssetManager
+from tools.disk_cache import TextureCache
+from tools.atlas import SpriteAtlas, CatCompositor
+from tools.text_cache import text_cache
+from tools.profiler import profiler
 class Director():
-    def __init__(self):
+    def __init__(self, dirty_rendering=DIRTY_RENDERING):
         self.screen = pg.display.set_mode((WIDTH, HEIGHT))
         self.current_scene = None
         self.running = True
         self.clock = pg.time.Clock()
         self.FPS = FPS
-        self.scenes = {
-            "menu": MenuScene(self),
-            "creation": CreationScene(self),
-            "infobox": InfoBoxScene(self)
-        }
+        self.dirty_rendering = dirty_rendering
+        self.focused = True
+        self.last_activity = time.monotonic()
+        disk_cache = TextureCache(TEXTURE_CACHE_DIR) if TEXTURE_CACHE else None
+        self.assets = AssetManager(ASSET_BUDGET, disk_cache=disk_cache)
+        # у листов свой бюджет: в общем они вытесняли бы друг друга и декодировались заново
+        self.atlas = SpriteAtlas(AssetManager(ATLAS_BUDGET, disk_cache=disk_cache))
+        self.cats = CatCompositor(self.atlas)
+        self.text_cache = text_cache
+        self.profiler = profiler
+        self.text_cache.prewarm(font, PREWARM_TEXTS, BLACK)
+        # сцены создаются при первом переходе на них
+        self.factories = {}
+        self.persistent = {}
+        self.scenes = {}
+        self.build_times = {}  # сцена -> секунды на создание
+        self.current_name = None
+        self.register_scene("menu", MenuScene)
+        self.register_scene("creation", CreationScene, persistent=False)
+        self.register_scene("infobox", InfoBoxScene, persistent=False)
+        self.register_scene("gallery", GalleryScene, persistent=False)
         pg.init()
         pg.mixer.init()
         pg.display.set_caption("KOTY")
-        self.current_scene = self.scenes["menu"]
+        self.loading = LoadingScene(self)
+        self.switch_scene("menu")
+
+    def register_scene(self, scene_name, factory, persistent=True):
+        """persistent=False - выгрузить сцену, когда с неё уходят"""
+        self.factories[scene_name] = factory
+        self.persistent[scene_name] = persistent
+
+    def get_scene(self, scene_name):
+        scene = self.scenes.get(scene_name)
+        if scene is None:
+            start = time.perf_counter()
+            scene = self.factories[scene_name](self)
+            self.build_times[scene_name] = time.perf_counter() - start
+            self.scenes[scene_name] = scene
+        return scene
+
+    def switch_scene(self, scene_name, preload=True):
+        if scene_name not in self.factories:
+            return
+        paths = getattr(self.factories[scene_name], "ASSETS", ())
+        if preload and scene_name not in self.scenes and not self.assets.ready(paths):
+            # пока ассеты декодируются в фоне, показываем экран загрузки
+            self.assets.preload(paths)
+            self.loading.start(scene_name, paths)
+            self.current_scene = self.loading
+            self.current_scene.on_enter()
+            return
+
+        previous = self.current_name
+        self.current_scene = self.get_scene(scene_name)
+        self.current_name = scene_name
+        self.current_scene.on_enter()
+        if previous is not None and previous != scene_name and not self.persistent[previous]:
+            self.release_scene(previous)
+
+    def release_scene(self, scene_name):
+        scene = self.scenes.pop(scene_name, None)
+        if scene is not None:
+            scene.cleanup()
 
-    def switch_scene(self, scene_name):
-        if scene_name in self.scenes:
-            self.current_scene = self.scenes[scene_name]
-            
     def quit(self):
         self.running = False
-    
+
+    def target_fps(self):
+        """Частота кадров: полная при активности, пониженная в простое и в фоне"""
+        if not self.focused or not pg.display.get_active():
+            return BACKGROUND_FPS
+        if time.monotonic() - self.last_activity > IDLE_DELAY:
+            return IDLE_FPS
+        return self.FPS
+
+    @property
+    def scene_name(self):
+        if self.current_scene is self.loading:
+            return "loading"
+        return self.current_name
+
+    def step(self):
+        """Один кадр главного цикла. Возвращает True, если кадр перерисован"""
+        dt = self.clock.tick(self.target_fps())/1000
+        prof = self.profiler
+        prof.begin_frame(self.scene_name)
+        events = pg.event.get()
+        for event in events:
+            if event.type == pg.QUIT:
+                self.running = False
+            elif event.type in (pg.WINDOWFOCUSLOST, pg.WINDOWMINIMIZED):
+                self.focused = False
+            elif event.type in (pg.WINDOWFOCUSGAINED, pg.WINDOWRESTORED):
+                self.focused = True
+            elif event.type == pg.KEYDOWN and event.key == PROFILER_KEY:
+                prof.overlay = not prof.overlay
+                self.current_scene.full_redraw = True
+            elif event.type == pg.KEYDOWN and event.key == PROFILER_EXPORT_KEY:
+                print("Профиль сохранён:", *prof.export())
+
+        if events or self.current_scene.animating or prof.overlay:
+            self.last_activity = time.monotonic()
+
+        self.current_scene.handle_events(events)
+        prof.mark(0)
+        self.current_scene.update(dt)
+        prof.mark(1)
+
+        # без событий и анимаций кадр не меняется - не перерисовываем
+        scene = self.current_scene
+        rendered = bool(events or scene.animating or scene.needs_redraw or prof.overlay)
+        if rendered:
+            scene.render(self.screen)
+            if prof.overlay:
+                scene.mark_dirty(prof.draw_overlay(self.screen))
+            prof.mark(2)
+            self.present(scene)
+            prof.mark(3)
+        prof.end_frame()
+        return rendered
+
+    def present(self, scene):
+        rects = scene.pop_dirty_rects()
+        if rects is None or (rects and not self.dirty_rendering):
+            pg.display.flip()
+        elif rects:
+            pg.display.update(rects)
+
     def run(self):
         while self.running:
-            dt = self.clock.tick(FPS)/1000
-            events = pg.event.get()
-            for event in events:
-                if event.type == pg.QUIT:
-                    self.running = False
-            
-            self.current_scene.handle_events(events)
-            self.current_scene.update(dt)
-            self.current_scene.render(self.screen)
-            pg.display.flip()
-        
+            self.step()
+
+        self.assets.shutdown()
         pg.quit()
         sys.exit()
-    
\ No newline at end of file
+
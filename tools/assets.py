@@ -0,0 +1,153 @@
+import time
+import pygame as pg
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from tools.profiler import profiler
+
+
+class AssetManager():
+    """Общий реестр изображений с ленивой загрузкой и LRU-вытеснением.
+
+    Ключ ассета - путь плюс преобразования (масштаб, colorkey, convert_alpha),
+    поэтому одна и та же картинка декодируется с диска один раз, а все
+    варианты строятся из неё.
+    """
+
+    def __init__(self, budget, workers=2, disk_cache=None):
+        self.budget = budget  # лимит памяти в байтах
+        self.used = 0
+        self._cache = OrderedDict()
+        self.workers = workers
+        self._pool = None
+        self._pending = {}  # путь -> future с декодированной картинкой
+        self._failed = set()
+        self.load_times = {}  # путь -> секунды на декодирование
+        self.disk_cache = disk_cache  # tools.disk_cache.TextureCache или None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def image(self, path, scale=1, colorkey=None, alpha=True):
+        """Вернуть поверхность для пути с учётом преобразований"""
+        key = (path, scale, colorkey, alpha)
+        surf = self._cache.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return surf
+
+        self.misses += 1
+        if scale != 1 or colorkey is not None:
+            # варианты строим из базовой картинки, а не декодируем заново
+            surf = self.image(path, alpha=alpha)
+            if scale != 1:
+                size = (int(surf.get_width() * scale), int(surf.get_height() * scale))
+                surf = pg.transform.scale(surf, size)
+            else:
+                surf = surf.copy()
+            if colorkey is not None:
+                surf.set_colorkey(colorkey)
+        else:
+            surf = self._load(path, alpha)
+
+        self._store(key, surf)
+        return surf
+
+    def _load(self, path, alpha):
+        future = self._pending.pop(path, None)
+        # если картинка уже декодируется в фоне, ждём её, а не читаем файл второй раз
+        surf = future.result() if future is not None else self._decode(path)
+        return surf.convert_alpha() if alpha else surf.convert()
+
+    def _decode(self, path):
+        start = time.perf_counter()
+        surf = self.disk_cache.load(path) if self.disk_cache is not None else None
+        if surf is None:
+            surf = pg.image.load(path)
+            if self.disk_cache is not None:
+                self.disk_cache.store(path, surf)
+        self.load_times[path] = time.perf_counter() - start
+        return surf
+
+    def preload(self, paths):
+        """Декодировать картинки в фоновых потоках.
+
+        Потоки только читают и распаковывают файлы, convert_alpha и
+        запись в кэш делает poll() в главном потоке.
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="assets")
+        for path in paths:
+            if path not in self._pending and not self.is_loaded(path):
+                self._failed.discard(path)
+                self._pending[path] = self._pool.submit(self._decode, path)
+
+    def poll(self):
+        """Забрать готовые картинки из фоновых потоков"""
+        collected = False
+        for path, future in list(self._pending.items()):
+            if future.done():
+                collected = True
+                try:
+                    self.image(path)
+                except Exception:
+                    # ошибку покажет сама сцена, когда попросит картинку
+                    self._failed.add(path)
+        if collected and not self._pending and self.disk_cache is not None:
+            # пачка предзагрузки готова - сохраняем манифест, чтобы записи пережили падение игры
+            self.disk_cache.save()
+
+    def is_loaded(self, path, alpha=True):
+        return (path, 1, None, alpha) in self._cache
+
+    def ready(self, paths):
+        """Все картинки декодированы и лежат в кэше"""
+        return all(self.is_loaded(path) or path in self._failed for path in paths)
+
+    def finished(self, paths):
+        """Фоновая загрузка путей закончилась - удачно или с ошибкой.
+
+        Не то же самое, что ready(): если ассеты вместе больше бюджета,
+        часть уже вытеснена, и все сразу в кэше они не окажутся никогда.
+        """
+        return not any(path in self._pending for path in paths)
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        self._pending.clear()
+        if self.disk_cache is not None:
+            self.disk_cache.save()
+
+    def _store(self, key, surf):
+        self._cache[key] = surf
+        profiler.alloc()
+        self.used += self.surface_size(surf)
+        self._evict()
+
+    def _evict(self):
+        # последний добавленный ассет не выбрасываем, даже если он один больше лимита
+        while self.used > self.budget and len(self._cache) > 1:
+            _, surf = self._cache.popitem(last=False)
+            self.used -= self.surface_size(surf)
+            self.evictions += 1
+
+    @staticmethod
+    def surface_size(surf):
+        return surf.get_pitch() * surf.get_height()
+
+    def clear(self):
+        self._cache.clear()
+        self.used = 0
+
+    def stats(self):
+        """Счётчики для подбора бюджета"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._cache),
+            "used": self.used,
+            "budget": self.budget,
+        }
@@ -0,0 +1,106 @@
+import os
+import pygame as pg
+from collections import OrderedDict
+from tools.profiler import profiler
+
+SPRITES_DIR = "./from_clangen/sprites"
+SPRITE_SIZE = 50
+
+# раскладка листов clangen: каждый окрас (или шрам) - блок поз 3x8 спрайтов,
+# блоки идут слева направо строками. (ширина блока, высота блока, блоков в строке)
+LAYOUTS = {
+    "pelts": (3, 8, 7),
+    "skin": (3, 8, 6),
+    "scars": (3, 8, 12),
+    "scars_missing_part": (3, 8, 8),
+}
+
+
+class SpriteAtlas():
+    """Спрайтшиты clangen с адресацией (лист, окрас, поза).
+
+    Листы берутся через менеджер ассетов; атласу нужен свой менеджер с
+    бюджетом на все листы, чтобы каждый декодировался один раз. Спрайты
+    отдаются как subsurface, то есть без копирования пикселей.
+    """
+
+    def __init__(self, assets, root=SPRITES_DIR, size=SPRITE_SIZE):
+        self.assets = assets
+        self.root = root
+        self.size = size
+
+    def sheet(self, name):
+        """Лист по имени без расширения, например "pelts/colours_tabby" или "skin\""""
+        return self.assets.image(os.path.join(self.root, name + ".png"))
+
+    @staticmethod
+    def layout(name):
+        return LAYOUTS[name.split("/")[0]]
+
+    def grid(self, name, surf=None):
+        """Размер листа в блоках: (строки, столбцы)"""
+        width, height, per_row = self.layout(name)
+        if surf is None:
+            surf = self.sheet(name)
+        return surf.get_height() // (height * self.size), per_row
+
+    def sprite(self, name, index, pose):
+        """Поза pose окраса (или шрама) index; позы нумеруются по строкам блока"""
+        width, height, per_row = self.layout(name)
+        sheet = self.sheet(name)
+        rows, cols = self.grid(name, sheet)
+        if not (0 <= index < rows * cols and 0 <= pose < width * height):
+            raise IndexError(f"спрайт {(name, index, pose)} вне листа {rows}x{cols} блоков")
+        col = (index % per_row) * width + pose % width
+        row = (index // per_row) * height + pose // width
+        # subsurface не кэшируем: он дешёвый, а ссылка на него держала бы весь лист вне бюджета
+        return sheet.subsurface((col * self.size, row * self.size, self.size, self.size))
+
+    def pelt(self, pelt, colour, pose):
+        return self.sprite("pelts/colours_" + pelt, colour, pose)
+
+
+class CatCompositor():
+    """Собирает спрайт кота из слоёв: шерсть, кожа, шрамы.
+
+    Готовые спрайты кэшируются по ключу внешности, так что отрисовка
+    всего клана за кадр - это один blit на кота.
+    """
+
+    def __init__(self, atlas, max_entries=512):
+        self.atlas = atlas
+        self.max_entries = max_entries
+        self._cache = OrderedDict()
+
+    @staticmethod
+    def appearance_key(pelt, colour, pose, skin=None, scars=(), missing_scars=()):
+        return (pelt, colour, pose, skin, tuple(scars), tuple(missing_scars))
+
+    def compose(self, pelt, colour, pose, skin=None, scars=(), missing_scars=()):
+        key = self.appearance_key(pelt, colour, pose, skin, scars, missing_scars)
+        surf = self._cache.get(key)
+        if surf is not None:
+            self._cache.move_to_end(key)
+            return surf
+
+        size = self.atlas.size
+        surf = pg.Surface((size, size), pg.SRCALPHA)
+        surf.blit(self.atlas.pelt(pelt, colour, pose), (0, 0))
+        if skin is not None:
+            surf.blit(self.atlas.sprite("skin", skin, pose), (0, 0))
+        for scar in key[4]:
+            surf.blit(self.atlas.sprite("scars", scar, pose), (0, 0))
+        for scar in key[5]:
+            # отсутствующие части вырезают пиксели, а не рисуются поверх
+            surf.blit(self.atlas.sprite("scars_missing_part", scar, pose), (0, 0),
+                      special_flags=pg.BLEND_RGBA_MULT)
+
+        profiler.alloc()
+        profiler.blit(1 + (skin is not None) + len(key[4]) + len(key[5]))
+        self._cache[key] = surf
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self._cache.clear()
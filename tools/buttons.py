@@ -1,34 +1,81 @@
+import os
 import pygame as pg
 from config import BLACK
+from tools.text_cache import text_cache
+from tools.profiler import profiler
+
+NORMAL = "normal"
+HOVER = "hover"
+PRESSED = "pressed"
+DISABLED = "disabled"
+
+# суффиксы файлов clangen: button.png, button_hover.png, button_unavailable.png
+VARIANTS = {HOVER: "_hover", DISABLED: "_unavailable"}
+
+
 class Button():
-    def __init__(self, x, y, image, scale, text, font, text_color = BLACK):
-        width = image.get_width()
-        height = image.get_height()
-        self.image = pg.transform.scale(image, (int(width * scale), int(height * scale)))
+    """Кнопка только рисует себя; ввод разбирает tools.widgets.WidgetManager"""
+
+    def __init__(self, x, y, image, scale, text, font, text_color = BLACK, assets=None,
+                 on_click=None, enabled=True):
+        self.images = {}
+        if assets is not None:
+            # image - путь, масштабированный вариант общий для всех кнопок
+            self.image = assets.image(image, scale=scale)
+            root, ext = os.path.splitext(image)
+            for state, suffix in VARIANTS.items():
+                if os.path.exists(root + suffix + ext):
+                    self.images[state] = assets.image(root + suffix + ext, scale=scale)
+        elif scale != 1:
+            width = image.get_width()
+            height = image.get_height()
+            self.image = pg.transform.scale(image, (int(width * scale), int(height * scale)))
+        else:
+            self.image = image
+        # нажатая кнопка выглядит как наведённая - отдельных картинок в clangen нет
+        self.images.setdefault(HOVER, self.image)
+        self.images.setdefault(PRESSED, self.images[HOVER])
+        self.images.setdefault(DISABLED, self.image)
+        self.images[NORMAL] = self.image
+
         self.rect = self.image.get_rect(topleft=(x, y))
-        self.clicked = False
+        self.on_click = on_click
+        self.manager = None  # WidgetManager, в который добавлена кнопка
+        self.state = NORMAL if enabled else DISABLED
+        self.dirty = True
         self.text = text
         self.font = font
         self.text_color = text_color
-        self.text_surf = self.font.render(self.text, True, self.text_color)
+        self.text_surf = text_cache.render(self.font, self.text, self.text_color)
         self.text_rect = self.text_surf.get_rect(center=self.rect.center)
 
-    def draw(self, surface):
-        action = False
-        pos = pg.mouse.get_pos()
+    @property
+    def enabled(self):
+        return self.state != DISABLED
 
-        if self.rect.collidepoint(pos):
-            if pg.mouse.get_pressed()[0] and not self.clicked:
-                self.clicked = True
-                action = True
+    def set_enabled(self, enabled):
+        if enabled == self.enabled:
+            return
+        self.set_state(NORMAL if enabled else DISABLED)
+        if enabled and self.manager is not None:
+            # курсор мог остаться над кнопкой - наведение и нажатие знает менеджер
+            self.manager.refresh(self)
 
-        if not pg.mouse.get_pressed()[0]:
-            self.clicked = False
+    def set_state(self, state):
+        if state != self.state:
+            self.state = state
+            self.dirty = True
 
-        # пересчитываем центр текста
-        self.text_rect = self.text_surf.get_rect(center=self.rect.center)
+    def click(self):
+        if self.on_click is not None:
+            self.on_click()
 
-        surface.blit(self.image, self.rect)
-        surface.blit(self.text_surf, self.text_rect)
+    def draw(self, surface):
+        # пересчитываем центр текста, только если кнопку сдвинули
+        if self.text_rect.center != self.rect.center:
+            self.text_rect.center = self.rect.center
 
-        return action
+        surface.blit(self.images[self.state], self.rect)
+        surface.blit(self.text_surf, self.text_rect)
+        profiler.blit(2)
+        self.dirty = False
@@ -0,0 +1,221 @@
+"""Кэш декодированных текстур на диске.
+
+Для каждой картинки хранится сырой RGBA-буфер и запись в manifest.json:
+путь, mtime, размер файла, sha1, формат, размер и pitch. При загрузке буфер
+отображается в память (mmap) и оборачивается в Surface без распаковки PNG.
+
+    python -m tools.disk_cache build from_clangen images
+"""
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import threading
+import pygame as pg
+from concurrent.futures import ThreadPoolExecutor
+from config import TEXTURE_CACHE_DIR
+
+FORMAT = "RGBA"
+BYTES_PER_PIXEL = 4
+MANIFEST = "manifest.json"
+VERSION = 1
+
+
+def file_hash(path):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TextureCache():
+    def __init__(self, root=TEXTURE_CACHE_DIR):
+        self.root = root
+        self.manifest_path = os.path.join(root, MANIFEST)
+        self._lock = threading.Lock()
+        self._changed = False
+        self._write_failed = False
+        self.entries = {}
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == VERSION and isinstance(data.get("entries"), dict):
+                self.entries = data["entries"]
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    @staticmethod
+    def key(path):
+        return os.path.normpath(path)
+
+    def _raw_path(self, key):
+        return os.path.join(self.root, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".raw")
+
+    def _is_fresh(self, key, entry):
+        """Совпадает ли запись с исходником; mtime проверяем быстро, хэш - только если он сдвинулся"""
+        try:
+            st = os.stat(key)
+            if st.st_mtime_ns == entry["mtime"] and st.st_size == entry["source_size"]:
+                return True
+            if st.st_size != entry["source_size"] or file_hash(key) != entry["hash"]:
+                return False
+        except (OSError, KeyError, TypeError):
+            # нет исходника или запись в манифесте битая - считаем устаревшей
+            return False
+        # файл тронули, но содержимое то же - запоминаем новый mtime
+        with self._lock:
+            entry["mtime"] = st.st_mtime_ns
+            self._changed = True
+        return True
+
+    def load(self, path):
+        """Surface поверх mmap из кэша или None, если записи нет или она устарела"""
+        key = self.key(path)
+        with self._lock:
+            entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if not self._is_fresh(key, entry):
+            self.invalidate(key)
+            return None
+        try:
+            width, height = entry["size"]
+            pitch = entry["pitch"]
+            fmt = entry["format"]
+            if not all(isinstance(v, int) for v in (width, height, pitch)):
+                raise TypeError("размеры в манифесте не числа")
+        except (KeyError, TypeError, ValueError):
+            self.invalidate(key)
+            return None
+        try:
+            with open(self._raw_path(key), "rb") as f:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self.invalidate(key)
+            return None
+        if fmt != FORMAT or pitch != width * BYTES_PER_PIXEL or len(buf) != pitch * height:
+            buf.close()
+            self.invalidate(key)
+            return None
+        # строки лежат без выравнивания, поэтому pitch не передаём:
+        # frombuffer с явным pitch в pygame 2.6 падает
+        return pg.image.frombuffer(buf, (width, height), fmt)
+
+    def store(self, path, surf):
+        key = self.key(path)
+        try:
+            st = os.stat(key)
+            digest = file_hash(key)
+        except OSError:
+            return
+        width, height = surf.get_size()
+        raw_path = self._raw_path(key)
+        tmp_path = f"{raw_path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(pg.image.tobytes(surf, FORMAT))
+            os.replace(tmp_path, raw_path)
+        except OSError as e:
+            # кэш необязательный: картинка уже декодирована, просто не сохраняем её
+            if not self._write_failed:
+                print("Не удалось записать кэш текстур:", e)
+                self._write_failed = True
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self.entries[key] = {
+                "mtime": st.st_mtime_ns,
+                "source_size": st.st_size,
+                "hash": digest,
+                "format": FORMAT,
+                "size": [width, height],
+                "pitch": width * BYTES_PER_PIXEL,
+            }
+            self._changed = True
+
+    def invalidate(self, key):
+        with self._lock:
+            if self.entries.pop(key, None) is None:
+                return
+            self._changed = True
+        try:
+            os.remove(self._raw_path(key))
+        except OSError:
+            pass
+
+    def prune(self):
+        """Убрать записи, исходники которых удалены или изменились"""
+        for key, entry in list(self.entries.items()):
+            if not self._is_fresh(key, entry):
+                self.invalidate(key)
+
+    def save(self):
+        with self._lock:
+            if not self._changed:
+                return
+            data = {"version": VERSION, "entries": dict(self.entries)}
+            self._changed = False
+        tmp_path = self.manifest_path + ".tmp"
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            print("Не удалось сохранить манифест кэша текстур:", e)
+
+    def warm(self, path):
+        """Положить картинку в кэш, если её там ещё нет. True - если декодировали"""
+        key = self.key(path)
+        with self._lock:
+            entry = self.entries.get(key)
+        if entry is not None and self._is_fresh(key, entry):
+            return False
+        try:
+            surf = pg.image.load(path)
+        except (pg.error, OSError) as e:
+            # одна битая картинка не должна обрывать прогрев остальных
+            print("Не удалось декодировать картинку для кэша:", path, e)
+            return False
+        self.store(path, surf)
+        return True
+
+    def build(self, roots, workers=None):
+        """Прогреть кэш для всех PNG в каталогах параллельно"""
+        paths = []
+        for root in roots:
+            for folder, _, files in os.walk(root):
+                paths.extend(os.path.join(folder, name) for name in files if name.lower().endswith(".png"))
+        self.prune()
+        with ThreadPoolExecutor(workers) as pool:
+            decoded = sum(pool.map(self.warm, paths))
+        self.save()
+        return len(paths), decoded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Кэш декодированных текстур")
+    parser.add_argument("command", choices=["build", "clear"])
+    parser.add_argument("roots", nargs="*", default=["from_clangen", "images"])
+    parser.add_argument("--cache", default=TEXTURE_CACHE_DIR)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    cache = TextureCache(args.cache)
+    if args.command == "clear":
+        for key in list(cache.entries):
+            cache.invalidate(key)
+        cache.save()
+        return
+    total, decoded = cache.build(args.roots, args.workers)
+    print(f"Картинок: {total}, декодировано заново: {decoded}")
+
+
+if __name__ == '__main__':
+    main()
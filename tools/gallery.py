@@ -0,0 +1,215 @@
+import pygame as pg
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from config import BLACK
+from tools.profiler import profiler
+
+
+def make_thumbnail(path, size):
+    """Загрузить картинку и вписать в size с сохранением пропорций (в фоновом потоке)"""
+    image = pg.image.load(path)
+    if image.get_bitsize() not in (24, 32):
+        # smoothscale умеет только 24/32 бита, convert без окна в потоке не вызвать
+        full = pg.Surface(image.get_size(), pg.SRCALPHA, 32)
+        full.blit(image, (0, 0))
+        image = full
+    scale = min(size[0] / image.get_width(), size[1] / image.get_height())
+    return pg.transform.smoothscale(image, (max(1, int(image.get_width() * scale)),
+                                            max(1, int(image.get_height() * scale))))
+
+
+class ScrollGallery():
+    """Прокручиваемая сетка миниатюр для больших наборов картинок.
+
+    Декодируются только видимые строки и prefetch_rows строк вокруг них,
+    миниатюры делает пул потоков. Готовые лежат в LRU-кэше, а строки дальше
+    drop_rows от экрана выбрасываются, так что память не растёт с числом картинок.
+    """
+
+    def __init__(self, rect, paths, thumb_size=(150, 150), gap=10, prefetch_rows=2, drop_rows=6,
+                 workers=2, background=BLACK, placeholder=(60, 60, 60)):
+        self.rect = pg.Rect(rect)
+        self.paths = list(paths)
+        self.thumb_size = thumb_size
+        self.gap = gap
+        self.prefetch_rows = prefetch_rows
+        self.drop_rows = drop_rows
+        self.background = background
+        self.placeholder = placeholder
+
+        self.columns = max(1, (self.rect.width + gap) // (thumb_size[0] + gap))
+        self.row_height = thumb_size[1] + gap
+        self.rows = -(-len(self.paths) // self.columns)
+        self.max_scroll = max(0, self.rows * self.row_height - gap - self.rect.height)
+        # сверху - всё, что может держаться вокруг экрана до выброса
+        visible = self.rect.height // self.row_height + 2
+        self.max_entries = (visible + 2 * drop_rows) * self.columns
+
+        self.scroll = 0.0
+        self.target = 0.0
+        self._thumbs = OrderedDict()  # индекс -> Surface
+        self._pending = {}  # индекс -> future
+        self._pool = ThreadPoolExecutor(workers, thread_name_prefix="thumbs")
+        self._mouse = None
+        self._view = None  # уже нарисованная область прокрутки
+        self._view_scroll = None  # при каком scroll она нарисована
+        self._stale = set()  # видимые ячейки, для которых пришла миниатюра
+        self.dirty = True
+
+    @property
+    def animating(self):
+        return self.scroll != self.target or bool(self._pending)
+
+    def visible_rows(self):
+        first = int(self.scroll) // self.row_height
+        last = (int(self.scroll) + self.rect.height - 1) // self.row_height
+        return first, min(last, self.rows - 1)
+
+    def scroll_to(self, y):
+        self.target = float(min(max(0, y), self.max_scroll))
+
+    def scroll_by(self, dy):
+        self.scroll_to(self.target + dy)
+
+    def handle_events(self, events):
+        for event in events:
+            if event.type == pg.MOUSEMOTION:
+                self._mouse = event.pos
+            elif event.type == pg.MOUSEWHEEL:
+                if self._mouse is None or self.rect.collidepoint(self._mouse):
+                    self.scroll_by(-event.y * self.row_height // 2)
+            elif event.type == pg.KEYDOWN:
+                if event.key == pg.K_DOWN:
+                    self.scroll_by(self.row_height)
+                elif event.key == pg.K_UP:
+                    self.scroll_by(-self.row_height)
+                elif event.key == pg.K_PAGEDOWN:
+                    self.scroll_by(self.rect.height)
+                elif event.key == pg.K_PAGEUP:
+                    self.scroll_by(-self.rect.height)
+                elif event.key == pg.K_HOME:
+                    self.scroll_to(0)
+                elif event.key == pg.K_END:
+                    self.scroll_to(self.max_scroll)
+
+    def update(self, dt):
+        if self.scroll != self.target:
+            # плавно догоняем цель, последний пиксель - сразу
+            step = (self.target - self.scroll) * min(1.0, dt * 15)
+            self.scroll = self.target if abs(self.target - self.scroll) < 1 else self.scroll + step
+            self.dirty = True
+
+        first, last = self.visible_rows()
+        self._collect(first, last)
+        self._schedule(first, last)
+        self._drop(first, last)
+
+    def _collect(self, first, last):
+        """Забрать готовые миниатюры из потоков; convert_alpha - только здесь, в главном"""
+        for index, future in list(self._pending.items()):
+            if not future.done():
+                continue
+            del self._pending[index]
+            try:
+                thumb = future.result().convert_alpha()
+            except Exception as e:
+                print("Не удалось сделать миниатюру:", self.paths[index], e)
+                continue
+            profiler.alloc()
+            self._thumbs[index] = thumb
+            if first <= index // self.columns <= last:
+                self._stale.add(index)
+                self.dirty = True
+        while len(self._thumbs) > self.max_entries:
+            self._thumbs.popitem(last=False)
+
+    def _schedule(self, first, last):
+        # сначала видимые строки, затем запас по краям
+        rows = list(range(first, last + 1))
+        for k in range(1, self.prefetch_rows + 1):
+            rows += [first - k, last + k]
+        for row in rows:
+            if not 0 <= row < self.rows:
+                continue
+            for index in range(row * self.columns, min((row + 1) * self.columns, len(self.paths))):
+                if index in self._thumbs:
+                    self._thumbs.move_to_end(index)
+                elif index not in self._pending:
+                    self._pending[index] = self._pool.submit(make_thumbnail, self.paths[index], self.thumb_size)
+
+    def _drop(self, first, last):
+        """Выбросить строки и задания, ушедшие далеко за экран"""
+        low, high = first - self.drop_rows, last + self.drop_rows
+        for index in [i for i in self._thumbs if not low <= i // self.columns <= high]:
+            del self._thumbs[index]
+        for index in [i for i in self._pending if not low <= i // self.columns <= high]:
+            if self._pending[index].cancel():
+                del self._pending[index]
+
+    def _cell(self, index, scroll):
+        """Прямоугольник ячейки в координатах области прокрутки"""
+        x0 = (self.rect.width - self.columns * (self.thumb_size[0] + self.gap) + self.gap) // 2
+        return pg.Rect(x0 + (index % self.columns) * (self.thumb_size[0] + self.gap),
+                       (index // self.columns) * self.row_height - scroll, *self.thumb_size)
+
+    def _draw_area(self, area, scroll):
+        """Перерисовать в _view полосу area (координаты области прокрутки)"""
+        view = self._view
+        view.set_clip(area)
+        view.fill(self.background, area)
+        first = max(0, (scroll + area.top) // self.row_height)
+        last = min(self.rows - 1, (scroll + area.bottom - 1) // self.row_height)
+        for row in range(first, last + 1):
+            for index in range(row * self.columns, min((row + 1) * self.columns, len(self.paths))):
+                cell = self._cell(index, scroll)
+                thumb = self._thumbs.get(index)
+                if thumb is None:
+                    # fill сдвигает rect с отрицательным y к 0, не укорачивая - обрезаем сами
+                    view.fill(self.placeholder, cell.clip(area))
+                else:
+                    view.blit(thumb, thumb.get_rect(center=cell.center))
+                    profiler.blit()
+        view.set_clip(None)
+
+    def draw(self, surface):
+        """Нарисовать область, если она изменилась. Возвращает rect или None.
+
+        Уже нарисованное сдвигается через Surface.scroll, заново рисуются только
+        открывшаяся полоса и ячейки, для которых пришли миниатюры.
+        """
+        if not self.dirty:
+            return None
+        scroll = int(self.scroll)
+        full = pg.Rect((0, 0), self.rect.size)
+        if self._view is None:
+            self._view = pg.Surface(self.rect.size).convert()
+            profiler.alloc()
+        dy = scroll - self._view_scroll if self._view_scroll is not None else full.height
+        if abs(dy) >= full.height:
+            self._draw_area(full, scroll)
+        elif dy:
+            self._view.scroll(0, -dy)
+            if dy > 0:
+                self._draw_area(pg.Rect(0, full.height - dy, full.width, dy), scroll)
+            else:
+                self._draw_area(pg.Rect(0, 0, full.width, -dy), scroll)
+        for index in self._stale:
+            area = self._cell(index, scroll).clip(full)
+            if area:
+                self._draw_area(area, scroll)
+        self._stale.clear()
+        self._view_scroll = scroll
+
+        surface.blit(self._view, self.rect)
+        profiler.blit()
+        self.dirty = False
+        return self.rect
+
+    def stats(self):
+        return {"thumbnails": len(self._thumbs), "pending": len(self._pending), "max_entries": self.max_entries}
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pending.clear()
+        self._thumbs.clear()
+        self._view = None
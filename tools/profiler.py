@@ -0,0 +1,161 @@
+import csv
+import json
+import time
+import pygame as pg
+from array import array
+from config import PROFILER_FRAMES, WHITE
+
+PHASES = ("events", "update", "render", "present")
+PHASE_COLORS = ((90, 160, 255), (120, 220, 120), (255, 180, 60), (220, 90, 200))
+OVERLAY_SIZE = (260, 150)
+OVERLAY_FONT = (None, 18)
+
+
+class FrameProfiler():
+    """Время фаз кадра в кольцевом буфере.
+
+    Все буферы выделены заранее, в главном цикле только пишем в массивы
+    по индексу. Кроме времени считаются blit'ы и созданные поверхности
+    за кадр - их отмечают blit() и alloc() в коде отрисовки.
+    """
+
+    def __init__(self, capacity=PROFILER_FRAMES):
+        self.capacity = capacity
+        self.starts = array("d", [0.0]) * capacity  # начало кадра, с
+        self.times = array("d", [0.0]) * (capacity * len(PHASES))  # фазы, мс
+        self.scenes = array("H", [0]) * capacity
+        self.blits = array("L", [0]) * capacity
+        self.allocs = array("L", [0]) * capacity
+        self.scene_names = []
+        self._scene_ids = {}
+        self.index = 0  # слот текущего кадра
+        self.count = 0  # заполненных слотов
+        self._mark = 0.0
+        self.overlay = False
+        self._text = None  # свой маленький кэш, чтобы меняющиеся цифры не вытесняли подписи
+
+    def scene_id(self, name):
+        scene_id = self._scene_ids.get(name)
+        if scene_id is None:
+            scene_id = len(self.scene_names)
+            self.scene_names.append(name)
+            self._scene_ids[name] = scene_id
+        return scene_id
+
+    def begin_frame(self, scene_name):
+        i = self.index
+        base = i * len(PHASES)
+        for p in range(len(PHASES)):
+            self.times[base + p] = 0.0
+        self.scenes[i] = self.scene_id(scene_name)
+        self.blits[i] = 0
+        self.allocs[i] = 0
+        self._mark = time.perf_counter()
+        self.starts[i] = self._mark
+
+    def mark(self, phase):
+        """Закрыть фазу с номером phase (индекс в PHASES)"""
+        now = time.perf_counter()
+        self.times[self.index * len(PHASES) + phase] = (now - self._mark) * 1000
+        self._mark = now
+
+    def end_frame(self):
+        self.index = (self.index + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def blit(self, n=1):
+        self.blits[self.index] += n
+
+    def alloc(self, n=1):
+        self.allocs[self.index] += n
+
+    def frames(self):
+        """Слоты записанных кадров от старых к новым"""
+        first = (self.index - self.count) % self.capacity
+        return [(first + k) % self.capacity for k in range(self.count)]
+
+    def frame_time(self, i):
+        base = i * len(PHASES)
+        return sum(self.times[base:base + len(PHASES)])
+
+    def fps(self, history=None):
+        """Средний FPS за последние history кадров (по умолчанию - за весь буфер)"""
+        frames = self.frames()
+        if history is not None:
+            frames = frames[-history:]
+        if len(frames) < 2:
+            return 0.0
+        span = self.starts[frames[-1]] - self.starts[frames[0]]
+        return (len(frames) - 1) / span if span > 0 else 0.0
+
+    def draw_overlay(self, surface, history=120):
+        """Панель с FPS, графиком времени кадра и разбивкой по фазам"""
+        if self._text is None:
+            from tools.text_cache import TextCache
+            self._text = TextCache(max_entries=64)
+        rect = pg.Rect((0, 0), OVERLAY_SIZE)
+        rect.topright = (surface.get_width() - 10, 10)
+        panel = surface.subsurface(rect)
+        panel.fill((20, 20, 20))
+
+        frames = self.frames()[-history:]
+        text = f"{self.fps(history):.0f} FPS"
+        if frames:
+            text += f"  {self.frame_time(frames[-1]):.1f} ms"
+        panel.blit(self._text.render(OVERLAY_FONT, text, WHITE), (6, 4))
+
+        # график: столбик на кадр, 1 px = 1 мс, линия - бюджет 60 FPS
+        graph_bottom = 84
+        pg.draw.line(panel, (200, 60, 60), (0, graph_bottom - 16), (rect.width, graph_bottom - 16))
+        for x, i in enumerate(frames[-rect.width // 2:]):
+            height = min(60, int(self.frame_time(i)))
+            pg.draw.line(panel, WHITE, (x * 2, graph_bottom), (x * 2, graph_bottom - height))
+
+        # средние по фазам за видимое окно
+        y = graph_bottom + 4
+        for p, name in enumerate(PHASES):
+            avg = sum(self.times[i * len(PHASES) + p] for i in frames) / len(frames) if frames else 0.0
+            pg.draw.rect(panel, PHASE_COLORS[p], (6, y + 3, min(100, int(avg * 10)) + 1, 8))
+            panel.blit(self._text.render(OVERLAY_FONT, f"{name} {avg:.2f}", WHITE), (112, y))
+            y += 15
+        return rect
+
+    def export_csv(self, path):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "scene", "start_ms"] + [p + "_ms" for p in PHASES]
+                            + ["total_ms", "blits", "allocs"])
+            for n, i in enumerate(self.frames()):
+                base = i * len(PHASES)
+                writer.writerow([n, self.scene_names[self.scenes[i]], round(self.starts[i] * 1000, 3)]
+                                + [round(t, 4) for t in self.times[base:base + len(PHASES)]]
+                                + [round(self.frame_time(i), 4), self.blits[i], self.allocs[i]])
+
+    def export_chrome_trace(self, path):
+        """Формат chrome://tracing / Perfetto: кадр и его фазы как вложенные события"""
+        events = []
+        for n, i in enumerate(self.frames()):
+            start = self.starts[i] * 1e6
+            scene = self.scene_names[self.scenes[i]]
+            events.append({"name": "frame", "cat": scene, "ph": "X", "pid": 1, "tid": 1,
+                           "ts": start, "dur": self.frame_time(i) * 1000,
+                           "args": {"frame": n, "blits": self.blits[i], "allocs": self.allocs[i]}})
+            for p, name in enumerate(PHASES):
+                dur = self.times[i * len(PHASES) + p] * 1000
+                events.append({"name": name, "cat": scene, "ph": "X", "pid": 1, "tid": 1,
+                               "ts": start, "dur": dur})
+                start += dur
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def export(self, prefix="profile"):
+        """Выгрузить окно в CSV и Chrome trace, вернуть пути"""
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        paths = (f"{prefix}_{stamp}.csv", f"{prefix}_{stamp}.json")
+        self.export_csv(paths[0])
+        self.export_chrome_trace(paths[1])
+        return paths
+
+
+profiler = FrameProfiler()
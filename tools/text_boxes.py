@@ -1,7 +1,10 @@
 import pygame as pg
 from config import BROWN
+from tools.text_cache import text_cache
+from tools.profiler import profiler
 
 class Text():
+    # font - пара (файл, размер), см. config.font
     def __init__(self, x, y, text, font, text_color = BROWN, center=True):
         self.x = x
         self.y = y
@@ -10,7 +13,7 @@ class Text():
         self.text_color = text_color
         self.center = center
         
-        self.text_surf = self.font.render(self.text, True, self.text_color)
+        self.text_surf = text_cache.render(self.font, self.text, self.text_color)
         self.text_rect = self.text_surf.get_rect()
         
         # Размещаем текст по координатам
@@ -21,11 +24,14 @@ class Text():
     
     def draw(self, surface):
         surface.blit(self.text_surf, self.text_rect)
+        profiler.blit()
     
     def update_text(self, new_text):
         """Обновить текст"""
+        if new_text == self.text:
+            return
         self.text = new_text
-        self.text_surf = self.font.render(self.text, True, self.text_color)
+        self.text_surf = text_cache.render(self.font, self.text, self.text_color)
         self.text_rect = self.text_surf.get_rect(center=self.text_rect.center if self.center else self.text_rect.topleft)
     
     def set_position(self, x, y):
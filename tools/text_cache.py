@@ -0,0 +1,64 @@
+import pygame as pg
+from collections import OrderedDict
+from config import TEXT_CACHE_SIZE
+from tools.profiler import profiler
+
+
+class TextCache():
+    """Кэш шрифтов и отрисованного текста.
+
+    Шрифт задаётся парой (файл, размер) и открывается при первом обращении.
+    Поверхности с текстом хранятся по ключу (файл, размер, текст, цвет,
+    сглаживание) и вытесняются по LRU.
+    """
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._fonts = {}
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, font):
+        """Объект pg.font.Font для пары (файл, размер)"""
+        obj = self._fonts.get(font)
+        if obj is None:
+            path, size = font
+            obj = pg.font.Font(path, size)
+            self._fonts[font] = obj
+        return obj
+
+    def render(self, font, text, color, antialias=True):
+        key = (font[0], font[1], text, tuple(color), antialias)
+        surf = self._cache.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return surf
+
+        self.misses += 1
+        surf = self.font(font).render(text, antialias, color)
+        profiler.alloc()
+        self._cache[key] = surf
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return surf
+
+    def prewarm(self, font, texts, color, antialias=True):
+        """Заранее отрисовать частые строки, например при запуске"""
+        for text in texts:
+            self.render(font, text, color, antialias)
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._cache),
+            "fonts": len(self._fonts),
+        }
+
+
+text_cache = TextCache()
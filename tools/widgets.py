@@ -0,0 +1,113 @@
+import pygame as pg
+from tools.buttons import NORMAL, HOVER, PRESSED, DISABLED
+
+GRID_CELL = 64  # сторона ячейки пространственного индекса, px
+
+
+class WidgetManager():
+    """Разбирает события мыши для виджетов сцены и рисует только изменённые.
+
+    Виджет - объект с rect, state, dirty, manager, set_state(), click() и draw(),
+    например tools.buttons.Button. Попадание ищется по сетке: проверяются
+    только виджеты из ячейки под курсором, а не все подряд.
+    """
+
+    def __init__(self, cell=GRID_CELL):
+        self.cell = cell
+        self.widgets = []
+        self._grid = {}  # (столбец, строка) -> виджеты в ячейке
+        self.hovered = None
+        self.pressed = None
+
+    def _cells(self, rect):
+        for cx in range(rect.left // self.cell, (rect.right - 1) // self.cell + 1):
+            for cy in range(rect.top // self.cell, (rect.bottom - 1) // self.cell + 1):
+                yield cx, cy
+
+    def add(self, widget):
+        self.widgets.append(widget)
+        widget.manager = self
+        for cell in self._cells(widget.rect):
+            self._grid.setdefault(cell, []).append(widget)
+        widget.dirty = True
+        return widget
+
+    def remove(self, widget):
+        self.widgets.remove(widget)
+        widget.manager = None
+        for cell in self._cells(widget.rect):
+            self._grid[cell].remove(widget)
+        if self.hovered is widget:
+            self.hovered = None
+        if self.pressed is widget:
+            self.pressed = None
+
+    def move(self, widget, x, y):
+        """Сдвинуть виджет с переиндексацией; старое место нужно перерисовать сцене"""
+        self.remove(widget)
+        widget.rect.topleft = (x, y)
+        self.add(widget)
+
+    def clear(self):
+        self.widgets.clear()
+        self._grid.clear()
+        self.hovered = None
+        self.pressed = None
+
+    def widget_at(self, pos):
+        cell = (pos[0] // self.cell, pos[1] // self.cell)
+        # добавленные позже лежат выше
+        for widget in reversed(self._grid.get(cell, ())):
+            if widget.rect.collidepoint(pos):
+                return widget
+        return None
+
+    def refresh(self, widget):
+        """Выставить виджету normal/hover/pressed по текущему наведению и нажатию"""
+        if widget is None or widget.state == DISABLED:
+            return
+        if widget is self.pressed and widget is self.hovered:
+            widget.set_state(PRESSED)
+        elif widget is self.hovered:
+            widget.set_state(HOVER)
+        else:
+            widget.set_state(NORMAL)
+
+    def _hover(self, pos):
+        widget = self.widget_at(pos) if pos is not None else None
+        if widget is not self.hovered:
+            previous, self.hovered = self.hovered, widget
+            self.refresh(previous)
+            self.refresh(widget)
+
+    def sync(self, pos):
+        """Сбросить нажатие и выставить наведение по текущей позиции мыши"""
+        pressed, self.pressed = self.pressed, None
+        self.refresh(pressed)
+        self._hover(pos)
+
+    def handle_events(self, events):
+        for event in events:
+            if event.type == pg.MOUSEMOTION:
+                self._hover(event.pos)
+            elif event.type == pg.MOUSEBUTTONDOWN and event.button == 1:
+                self._hover(event.pos)
+                if self.hovered is not None and self.hovered.state != DISABLED:
+                    self.pressed = self.hovered
+                    self.refresh(self.pressed)
+            elif event.type == pg.MOUSEBUTTONUP and event.button == 1:
+                self._hover(event.pos)
+                widget, self.pressed = self.pressed, None
+                self.refresh(widget)
+                # клик - отпустили над той же кнопкой, на которой нажали
+                if widget is not None and widget is self.hovered and widget.state != DISABLED:
+                    widget.click()
+            elif event.type == pg.WINDOWLEAVE:
+                self._hover(None)
+
+    def draw(self, scene, screen):
+        """Перерисовать изменённые виджеты (или все, если сцена рисуется целиком)"""
+        for widget in self.widgets:
+            if widget.dirty or scene.full_redraw:
+                scene.restore_background(screen, widget.rect)
+                widget.draw(screen)